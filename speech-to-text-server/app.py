@@ -10,12 +10,19 @@ Endpoints:
     - POST /transcribe: Transcribe audio file to text
 """
 
+import io
 import os
+import time
+import wave
 import logging
-import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 from flask import Flask, request, jsonify
+from flask_compress import Compress
 from flask_cors import CORS
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 
 # Configure logging
 logging.basicConfig(
@@ -27,29 +34,142 @@ logger = logging.getLogger(__name__)
 # Initialize Flask app
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
+Compress(app)  # gzip JSON responses for clients that accept it
+
+# Reject oversized uploads up front instead of buffering them in full
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
+
+# Audio shorter than this can't contain usable speech; skip the model
+MIN_AUDIO_SECONDS = 0.3
 
 # Configuration from environment variables
+# WHISPER_COMPUTE_TYPE options:
+#   - auto: let CTranslate2 pick the fastest supported type per device
+#   - int8: best on CPU
+#   - float16: good on GPU
+#   - int8_float16: usually fastest on GPU (int8 weights, fp16 compute)
 MODEL_SIZE = os.environ.get('WHISPER_MODEL', 'base')
 DEVICE = os.environ.get('WHISPER_DEVICE', 'cpu')
-COMPUTE_TYPE = os.environ.get('WHISPER_COMPUTE_TYPE', 'int8')
+COMPUTE_TYPE = os.environ.get('WHISPER_COMPUTE_TYPE', 'auto')
+
+# Optional path to a pre-converted (and pre-quantized) CTranslate2 model
+# directory, e.g. produced by convert_model.py. Loading quantized weights
+# from disk skips the on-the-fly quantization done on every startup.
+MODEL_DIR = os.environ.get('WHISPER_MODEL_DIR', '')
+
+# Concurrency settings:
+#   WHISPER_NUM_WORKERS: parallel transcriptions (CTranslate2 releases
+#     the GIL during compute, so Python threads scale)
+#   WHISPER_CPU_THREADS: intra-op threads per transcription (0 = auto)
+#   WHISPER_DEVICE_INDEX: comma-separated GPU indices, e.g. "0,1"
+NUM_WORKERS = int(os.environ.get('WHISPER_NUM_WORKERS', '1'))
+CPU_THREADS = int(os.environ.get('WHISPER_CPU_THREADS', '0'))
+DEVICE_INDEX = [int(i) for i in os.environ.get('WHISPER_DEVICE_INDEX', '0').split(',')]
+
+# Batched inference settings: audio longer than BATCH_THRESHOLD seconds
+# is split on VAD boundaries and decoded BATCH_SIZE segments at a time,
+# which is much faster than sequential decoding for long recordings.
+BATCH_SIZE = int(os.environ.get('WHISPER_BATCH_SIZE', '8'))
+BATCH_THRESHOLD = float(os.environ.get('WHISPER_BATCH_THRESHOLD', '30'))
+
+# Re-warm the model this often (seconds) so the first request after an
+# idle period doesn't pay kernel/cache re-initialization costs. 0 disables.
+WARMUP_INTERVAL = float(os.environ.get('WHISPER_WARMUP_INTERVAL', '240'))
+
+
+class ModelPool:
+    """
+    Serves transcriptions through a shared WhisperModel with a bounded
+    worker pool.
 
-# Global model variable (loaded once at startup)
+    CTranslate2 supports multiple concurrent computations on one model
+    via num_workers; the executor caps in-flight requests at the same
+    number so extra requests queue instead of oversubscribing the CPU/GPU.
+    """
+
+    def __init__(self, model_size, device, compute_type,
+                 num_workers=1, cpu_threads=0, device_index=None):
+        self.model = WhisperModel(
+            model_size,
+            device=device,
+            device_index=device_index if device_index else 0,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers
+        )
+        self._batched = BatchedInferencePipeline(self.model)
+        self._executor = ThreadPoolExecutor(max_workers=num_workers)
+
+    def transcribe(self, audio, **kwargs):
+        """
+        Run a transcription on a pool worker and return (text, info).
+
+        Segment iteration (where the actual compute happens) runs inside
+        the worker so concurrency stays bounded by the pool size.
+        """
+        return self._executor.submit(self._run, audio, **kwargs).result()
+
+    def _run(self, audio, **kwargs):
+        # Long recordings go through the batched pipeline, which splits
+        # the audio on VAD boundaries and decodes several chunks per
+        # model invocation. Short push-to-talk clips (the common case)
+        # stay on the sequential path where batching has no benefit.
+        if isinstance(audio, np.ndarray) and len(audio) / 16000 > BATCH_THRESHOLD:
+            segments, info = self._batched.transcribe(
+                audio, batch_size=BATCH_SIZE, **kwargs
+            )
+        else:
+            segments, info = self.model.transcribe(audio, **kwargs)
+        text = ' '.join(segment.text.strip() for segment in segments)
+        return text, info
+
+    @property
+    def compute_type(self):
+        """The compute type the underlying CTranslate2 model resolved to."""
+        return getattr(self.model.model, 'compute_type', None)
+
+
+# Global model pool (created once at startup)
 model = None
 
 
+def resolve_compute_type():
+    """
+    Resolve the compute type to use for the current device.
+
+    With 'auto', CTranslate2 picks the fastest supported type, except on
+    CUDA where we prefer int8_float16 (int8 weights with fp16 compute),
+    which is typically faster and uses ~2x less VRAM than plain float16.
+    """
+    compute_type = COMPUTE_TYPE or 'auto'
+    if compute_type == 'auto' and DEVICE == 'cuda':
+        return 'int8_float16'
+    return compute_type
+
+
 def load_model():
     """
     Load the Whisper model into memory.
     This is done once at startup to avoid loading delays during transcription.
     """
     global model
-    logger.info(f"Loading Whisper model: {MODEL_SIZE} on {DEVICE} with {COMPUTE_TYPE}")
+    compute_type = resolve_compute_type()
+    model_path = MODEL_DIR if MODEL_DIR and os.path.isdir(MODEL_DIR) else MODEL_SIZE
+    if MODEL_DIR and model_path != MODEL_DIR:
+        logger.warning(f"WHISPER_MODEL_DIR not found: {MODEL_DIR}, falling back to '{MODEL_SIZE}'")
+    logger.info(
+        f"Loading Whisper model: {model_path} on {DEVICE} with {compute_type} "
+        f"({NUM_WORKERS} worker(s))"
+    )
 
     try:
-        model = WhisperModel(
-            MODEL_SIZE,
+        model = ModelPool(
+            model_path,
             device=DEVICE,
-            compute_type=COMPUTE_TYPE
+            compute_type=compute_type,
+            num_workers=NUM_WORKERS,
+            cpu_threads=CPU_THREADS,
+            device_index=DEVICE_INDEX
         )
         logger.info("Whisper model loaded successfully")
     except Exception as e:
@@ -57,91 +177,242 @@ def load_model():
         raise
 
 
+def warm_up():
+    """
+    Run one second of silence through the model.
+
+    The first real transcription otherwise pays one-time kernel compile
+    and cache initialization costs (1-2s), which this absorbs at startup
+    instead of on the user's first utterance.
+    """
+    silence = np.zeros(16000, dtype=np.float32)
+    try:
+        model.transcribe(silence, beam_size=1, vad_filter=False)
+    except Exception as e:
+        logger.warning(f"Model warm-up failed: {e}")
+
+
+def start_warmup_thread():
+    """
+    Warm the model in the background, then keep it warm while idle.
+
+    Runs in a daemon thread so startup isn't blocked; the periodic
+    re-warm prevents the noticeable re-initialization delay after long
+    idle periods.
+    """
+    def _loop():
+        warm_up()
+        logger.info("Model warm-up complete")
+        if WARMUP_INTERVAL <= 0:
+            return
+        while True:
+            time.sleep(WARMUP_INTERVAL)
+            warm_up()
+
+    threading.Thread(target=_loop, daemon=True).start()
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """
     Health check endpoint.
     Returns the status of the server and model information.
     """
+    # Report the compute type actually in use (e.g. what 'auto' resolved to)
+    compute_type = resolve_compute_type()
+    if model is not None and model.compute_type:
+        compute_type = model.compute_type
+
     return jsonify({
         'status': 'healthy',
         'model': MODEL_SIZE,
         'device': DEVICE,
-        'compute_type': COMPUTE_TYPE
+        'compute_type': compute_type
     }), 200
 
 
+def decode_wav_pcm(wav_bytes):
+    """
+    Decode an in-memory WAV file to a float32 PCM array, if possible.
+
+    faster-whisper accepts a 16 kHz mono float32 array directly, which
+    skips the temp-file write and the ffmpeg decode subprocess. Returns
+    None if the audio is not 16 kHz mono 16-bit PCM (e.g. mp3/ogg or a
+    different sample rate), in which case the caller should fall back to
+    the file-based path.
+    """
+    try:
+        with wave.open(io.BytesIO(wav_bytes), 'rb') as wf:
+            if (wf.getnchannels() != 1 or
+                    wf.getsampwidth() != 2 or
+                    wf.getframerate() != 16000):
+                return None
+            frames = wf.readframes(wf.getnframes())
+    except (wave.Error, EOFError):
+        return None
+
+    return np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+
+
 @app.route('/transcribe', methods=['POST'])
 def transcribe():
     """
-    Transcribe an audio file to text.
+    Transcribe audio to text.
 
-    Expects:
-        - A file in the request with key 'audio'
-        - Optional 'language' parameter (default: auto-detect)
+    Accepts either:
+        - Raw 16 kHz mono int16 PCM as the request body with
+          Content-Type: application/octet-stream and X-Sample-Rate /
+          X-Channels / X-Format headers describing it (fastest - no
+          container parsing at all), or
+        - A multipart file upload with key 'audio'
+
+    Optional parameters (form fields, or query string for raw posts):
+        - 'language' (default: auto-detect)
+        - 'beam_size' (default: 1, greedy decoding)
 
     Returns:
         - JSON with 'text' containing the transcription
         - JSON with 'error' on failure
     """
-    # Check if audio file is present in request
-    if 'audio' not in request.files:
-        logger.warning("No audio file provided in request")
-        return jsonify({'error': 'No audio file provided'}), 400
-
-    audio_file = request.files['audio']
+    is_raw_pcm = (request.content_type or '').startswith('application/octet-stream')
 
-    # Check if filename is empty
-    if audio_file.filename == '':
-        logger.warning("Empty filename provided")
-        return jsonify({'error': 'Empty filename'}), 400
+    # Raw posts carry no form data, so parameters come from the query string
+    params = request.args if is_raw_pcm else request.form
 
     # Get optional language parameter
-    language = request.form.get('language', None)
+    language = params.get('language', None)
 
-    # Create a temporary file to store the uploaded audio
-    temp_file = None
+    # Optional beam size override. Greedy decoding (beam_size=1) is the
+    # default: for short push-to-talk utterances it is ~3-5x faster than
+    # beam search with near-identical accuracy.
     try:
-        # Save uploaded file to temporary location
-        temp_file = tempfile.NamedTemporaryFile(
-            delete=False,
-            suffix='.wav'
-        )
-        audio_file.save(temp_file.name)
-        temp_file.close()
+        beam_size = int(params.get('beam_size', 1))
+    except ValueError:
+        return jsonify({'error': 'beam_size must be an integer'}), 400
+
+    if is_raw_pcm:
+        # Fastest path: raw PCM needs no WAV parsing or ffmpeg decode
+        sample_rate = int(request.headers.get('X-Sample-Rate', 16000))
+        if sample_rate != 16000:
+            return jsonify({'error': 'Raw PCM must be sampled at 16000 Hz'}), 400
+        channels = int(request.headers.get('X-Channels', 1))
+        if channels != 1:
+            return jsonify({'error': 'Raw PCM must be mono'}), 400
+        pcm_format = request.headers.get('X-Format', 'int16')
+        if pcm_format != 'int16':
+            return jsonify({'error': 'Raw PCM must be int16'}), 400
+        if not request.data:
+            return jsonify({'error': 'Empty request body'}), 400
+    else:
+        # Check if audio file is present in request
+        if 'audio' not in request.files:
+            logger.warning("No audio file provided in request")
+            return jsonify({'error': 'No audio file provided'}), 400
+
+        audio_file = request.files['audio']
+
+        # Check if filename is empty
+        if audio_file.filename == '':
+            logger.warning("Empty filename provided")
+            return jsonify({'error': 'Empty filename'}), 400
 
-        logger.info(f"Processing audio file: {audio_file.filename}")
+    try:
+        if is_raw_pcm:
+            logger.info(f"Processing raw PCM: {len(request.data)} bytes")
+            audio_input = (np.frombuffer(request.data, dtype=np.int16)
+                           .astype(np.float32) / 32768.0)
+        else:
+            logger.info(f"Processing audio file: {audio_file.filename}")
+
+            # Fast path: decode 16 kHz mono PCM WAV (what the client sends)
+            # in memory and hand the array straight to the model, skipping
+            # the temp-file write and ffmpeg decode.
+            audio_bytes = audio_file.read()
+            audio_input = decode_wav_pcm(audio_bytes)
+
+            if audio_input is None:
+                # Fallback for non-PCM/non-16k uploads: faster-whisper
+                # decodes file-like objects via PyAV, so the bytes never
+                # need to touch disk.
+                audio_input = io.BytesIO(audio_bytes)
+
+        return jsonify(run_transcription(audio_input, language, beam_size)), 200
+
+    except Exception as e:
+        logger.error(f"Transcription error: {e}")
+        return jsonify({'error': str(e)}), 500
 
-        # Transcribe the audio file
-        segments, info = model.transcribe(
-            temp_file.name,
-            language=language,
-            beam_size=5,
-            vad_filter=True  # Voice Activity Detection for better accuracy
-        )
 
-        # Combine all segments into a single text
-        transcription = ' '.join([segment.text.strip() for segment in segments])
+def run_transcription(audio_input, language, beam_size):
+    """
+    Transcribe one audio input with the server's decoding settings.
 
-        logger.info(f"Transcription complete. Detected language: {info.language}")
+    Greedy decoding with temperature fallback: retry at higher
+    temperatures only if decoding fails, instead of paying for beam
+    search on every request. Too-short audio (mirrors the client-side
+    guard) returns empty text without paying for a model invocation.
+    """
+    if (isinstance(audio_input, np.ndarray) and
+            len(audio_input) < MIN_AUDIO_SECONDS * 16000):
+        logger.info("Audio too short to transcribe, returning empty text")
+        return {'text': '', 'language': None}
+
+    transcription, info = model.transcribe(
+        audio_input,
+        language=language,
+        beam_size=beam_size,
+        temperature=[0.0, 0.2, 0.4, 0.6, 0.8, 1.0],
+        condition_on_previous_text=False,
+        no_speech_threshold=0.6,
+        vad_filter=True,  # Voice Activity Detection for better accuracy
+        vad_parameters={'min_silence_duration_ms': 500}
+    )
+
+    logger.info(f"Transcription complete. Detected language: {info.language}")
+
+    return {
+        'text': transcription,
+        'language': info.language,
+        'language_probability': info.language_probability
+    }
 
-        return jsonify({
-            'text': transcription,
-            'language': info.language,
-            'language_probability': info.language_probability
-        }), 200
 
-    except Exception as e:
-        logger.error(f"Transcription error: {e}")
-        return jsonify({'error': str(e)}), 500
+@app.route('/transcribe-batch', methods=['POST'])
+def transcribe_batch():
+    """
+    Transcribe several audio files in one request.
+
+    Expects multiple multipart files under the 'audio' key plus the same
+    optional 'language'/'beam_size' form fields as /transcribe. Returns
+    {'results': [...]} in upload order; a failure in one file yields an
+    'error' entry for that file without failing the whole batch.
+    """
+    files = request.files.getlist('audio')
+    if not files:
+        logger.warning("No audio files provided in batch request")
+        return jsonify({'error': 'No audio files provided'}), 400
+
+    language = request.form.get('language', None)
+    try:
+        beam_size = int(request.form.get('beam_size', 1))
+    except ValueError:
+        return jsonify({'error': 'beam_size must be an integer'}), 400
+
+    logger.info(f"Processing batch of {len(files)} audio files")
+
+    results = []
+    for audio_file in files:
+        try:
+            audio_bytes = audio_file.read()
+            audio_input = decode_wav_pcm(audio_bytes)
+            if audio_input is None:
+                audio_input = io.BytesIO(audio_bytes)
+            results.append(run_transcription(audio_input, language, beam_size))
+        except Exception as e:
+            logger.error(f"Batch transcription error ({audio_file.filename}): {e}")
+            results.append({'error': str(e)})
 
-    finally:
-        # Clean up temporary file
-        if temp_file and os.path.exists(temp_file.name):
-            try:
-                os.unlink(temp_file.name)
-            except Exception as e:
-                logger.warning(f"Failed to delete temp file: {e}")
+    return jsonify({'results': results}), 200
 
 
 @app.route('/models', methods=['GET'])
@@ -155,7 +426,10 @@ def list_models():
         'base': 'Fast, good accuracy (~1GB VRAM)',
         'small': 'Balanced speed/accuracy (~2GB VRAM)',
         'medium': 'High accuracy, slower (~5GB VRAM)',
-        'large-v3': 'Best accuracy, slowest (~10GB VRAM)'
+        'large-v3': 'Best accuracy, slowest (~10GB VRAM)',
+        'distil-small.en': 'English-only distilled small, faster than base (~2GB VRAM)',
+        'distil-medium.en': 'English-only distilled medium, near-medium accuracy (~3GB VRAM)',
+        'large-v3-turbo': 'large-v3 with a 4-layer decoder, ~8x less decode compute (~6GB VRAM)'
     }
     return jsonify({
         'available_models': models,
@@ -180,9 +454,10 @@ def internal_server_error(error):
 # Load model when the application starts
 with app.app_context():
     load_model()
+    start_warmup_thread()
 
 
 if __name__ == '__main__':
-    # Run with debug mode for development
-    # In production, use gunicorn: gunicorn -w 1 -b 0.0.0.0:5000 app:app
+    # Development only: Werkzeug serves one request at a time.
+    # In production, use gunicorn: gunicorn -c gunicorn.conf.py app:app
     app.run(host='0.0.0.0', port=5000, debug=False)
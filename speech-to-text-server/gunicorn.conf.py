@@ -0,0 +1,23 @@
+"""
+Gunicorn configuration for the speech-to-text server.
+
+Usage:
+    gunicorn -c gunicorn.conf.py app:app
+
+One worker with a thread pool: the Whisper model is memory-intensive so
+only one copy is loaded, while gthread workers let multiple requests
+enter concurrently. Actual transcription concurrency is bounded by
+WHISPER_NUM_WORKERS in app.py.
+
+preload_app is deliberately left off: with a single worker there is no
+copy-on-write to share, and preloading would run the model load and
+warm-up in the master pre-fork - the keep-warm daemon thread does not
+survive the fork (leaving the serving worker cold), and a CUDA context
+initialized before fork breaks the GPU image outright.
+"""
+
+bind = '0.0.0.0:5000'
+workers = 1
+worker_class = 'gthread'
+threads = 8
+timeout = 120  # First request may wait on model download/load
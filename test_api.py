@@ -14,7 +14,6 @@ Options:
 import sys
 import argparse
 import wave
-import struct
 import math
 import tempfile
 import os
@@ -26,6 +25,13 @@ except ImportError:
     print("Install with: pip install requests")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: 'numpy' library not installed.")
+    print("Install with: pip install numpy")
+    sys.exit(1)
+
 
 def generate_test_tone(filename: str, duration: float = 1.0, frequency: float = 440.0):
     """
@@ -39,15 +45,16 @@ def generate_test_tone(filename: str, duration: float = 1.0, frequency: float =
     sample_rate = 16000
     num_samples = int(sample_rate * duration)
 
+    # Generate the sine wave as one vectorized operation and write it in
+    # a single call, instead of packing samples one at a time in Python
+    t = np.arange(num_samples, dtype=np.float32) / sample_rate
+    samples = (32767 * 0.3 * np.sin(2 * math.pi * frequency * t)).astype('<i2')
+
     with wave.open(filename, 'w') as wav_file:
         wav_file.setnchannels(1)
         wav_file.setsampwidth(2)  # 16-bit
         wav_file.setframerate(sample_rate)
-
-        for i in range(num_samples):
-            # Generate sine wave
-            value = int(32767 * 0.3 * math.sin(2 * math.pi * frequency * i / sample_rate))
-            wav_file.writeframes(struct.pack('<h', value))
+        wav_file.writeframes(samples.tobytes())
 
 
 def test_health(base_url: str) -> bool:
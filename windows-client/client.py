@@ -22,25 +22,32 @@ System Tray Icon Colors:
 
 Requirements:
     - Python 3.8+
-    - PyAudio, keyboard, requests, pyperclip, pystray, Pillow
+    - sounddevice, numpy, keyboard, requests, pyperclip, pystray, Pillow
     - Docker container running on localhost:5000
 """
 
+import io
 import os
 import sys
 import json
 import wave
-import tempfile
+import queue
+import hashlib
 import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
 import time
 from pathlib import Path
+from types import SimpleNamespace
 
 import subprocess
 
-import pyaudio
+import numpy as np
+import sounddevice as sd
 import keyboard
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import pyperclip
 import pystray
 from PIL import Image, ImageDraw
@@ -77,6 +84,9 @@ class Config:
             "format": "int16"
         },
         "language": None,  # Auto-detect
+        "stream_upload": False,  # Upload audio while still recording
+        "batch_max_size": 1,  # Coalesce up to N utterances per request (1 = off)
+        "batch_window_ms": 250,  # How long to wait for more utterances
         "copy_to_clipboard": True,
         "show_notifications": True,
         "auto_start_server": False,
@@ -88,6 +98,14 @@ class Config:
         """Load configuration from file or use defaults."""
         self.config_path = config_path or self._find_config_file()
         self.config = self._load_config()
+        # Freeze the merged dict into attribute access for readers:
+        # attribute lookup beats chained dict lookups on the hot path,
+        # and a typo fails loudly with AttributeError instead of
+        # silently defaulting
+        self.c = SimpleNamespace(**{
+            key: SimpleNamespace(**value) if isinstance(value, dict) else value
+            for key, value in self.config.items()
+        })
 
     def _find_config_file(self) -> str:
         """Find config file in common locations."""
@@ -128,6 +146,8 @@ class Config:
             json.dump(self.config, f, indent=2)
         logger.info(f"Saved config to: {self.config_path}")
 
+    # Dict-style access kept for backward compatibility; new code reads
+    # the frozen namespace (config.c.audio.sample_rate etc.)
     def __getitem__(self, key):
         return self.config[key]
 
@@ -136,32 +156,42 @@ class Config:
 
 
 class AudioRecorder:
-    """Handles audio recording using PyAudio."""
+    """Handles audio recording using sounddevice."""
 
-    # Map format strings to PyAudio constants
-    FORMAT_MAP = {
-        "int16": pyaudio.paInt16,
-        "int32": pyaudio.paInt32,
-        "float32": pyaudio.paFloat32
-    }
+    # Sample formats supported by sounddevice/PortAudio
+    SUPPORTED_FORMATS = ("int16", "int32", "float32")
+
+    # Leading/trailing windows quieter than this RMS are trimmed before
+    # upload; the server then skips encoder work on that silence
+    SILENCE_RMS_THRESHOLD = 300
+    SILENCE_WINDOW_SECONDS = 0.02
 
     def __init__(self, config: Config):
         """Initialize the audio recorder."""
         self.config = config
-        self.audio = pyaudio.PyAudio()
         self.stream = None
-        self.frames = []
         self.is_recording = False
+        # Optional tap: when set, the reader also feeds chunks to this
+        # queue so an uploader can stream them while recording continues
+        self.stream_queue = None
         self.lock = threading.Lock()
+        self._reader_thread = None
 
         # Audio settings
-        self.sample_rate = config['audio']['sample_rate']
-        self.channels = config['audio']['channels']
-        self.chunk_size = config['audio']['chunk_size']
-        self.format = self.FORMAT_MAP.get(
-            config['audio']['format'],
-            pyaudio.paInt16
-        )
+        self.sample_rate = config.c.audio.sample_rate
+        self.channels = config.c.audio.channels
+        self.chunk_size = config.c.audio.chunk_size
+        self.dtype = config.c.audio.format
+        if self.dtype not in self.SUPPORTED_FORMATS:
+            self.dtype = "int16"
+        self.sample_width = np.dtype(self.dtype).itemsize
+
+        # Pre-allocated sample buffer sized for a typical ~10 s hold;
+        # the reader writes at an offset so no allocation happens while
+        # recording, and capacity persists across utterances
+        samples_per_second = self.sample_rate * self.channels
+        self._buffer = np.empty(10 * samples_per_second, dtype=self.dtype)
+        self._write_pos = 0
 
     def start_recording(self):
         """Start recording audio from the microphone."""
@@ -169,30 +199,54 @@ class AudioRecorder:
             if self.is_recording:
                 return
 
-            self.frames = []
+            self._write_pos = 0
             self.is_recording = True
 
             try:
-                self.stream = self.audio.open(
-                    format=self.format,
+                self.stream = sd.InputStream(
+                    samplerate=self.sample_rate,
                     channels=self.channels,
-                    rate=self.sample_rate,
-                    input=True,
-                    frames_per_buffer=self.chunk_size,
-                    stream_callback=self._audio_callback
+                    dtype=self.dtype,
+                    blocksize=self.chunk_size,
+                    latency='low'
                 )
-                self.stream.start_stream()
-                logger.debug("Recording started")
+                self.stream.start()
             except Exception as e:
                 logger.error(f"Failed to start recording: {e}")
                 self.is_recording = False
+                self.stream = None
                 raise
 
-    def _audio_callback(self, in_data, frame_count, time_info, status):
-        """Callback for audio stream - collects audio frames."""
-        if self.is_recording:
-            self.frames.append(in_data)
-        return (in_data, pyaudio.paContinue)
+            # Blocking reads keep Python entirely off the PortAudio
+            # callback thread; only this reader thread runs Python
+            self._reader_thread = threading.Thread(
+                target=self._read_loop, daemon=True
+            )
+            self._reader_thread.start()
+            logger.debug("Recording started")
+
+    def _read_loop(self):
+        """Reader thread: drain the stream into the sample buffer."""
+        while self.is_recording:
+            try:
+                data, overflowed = self.stream.read(self.chunk_size)
+            except Exception as e:
+                logger.warning(f"Audio read error: {e}")
+                break
+            if overflowed:
+                logger.debug("Audio input overflow")
+
+            samples = data.ravel()
+            end = self._write_pos + len(samples)
+            if end > len(self._buffer):
+                # Double the capacity; only happens on unusually long holds
+                self._buffer = np.concatenate(
+                    [self._buffer, np.empty(len(self._buffer), dtype=self.dtype)]
+                )
+            self._buffer[self._write_pos:end] = samples
+            self._write_pos = end
+            if self.stream_queue is not None:
+                self.stream_queue.put(samples.tobytes())
 
     def stop_recording(self) -> bytes:
         """Stop recording and return the audio data."""
@@ -202,47 +256,142 @@ class AudioRecorder:
 
             self.is_recording = False
 
+            # Wait for the reader to finish its last blocking read
+            if self._reader_thread:
+                self._reader_thread.join(timeout=2)
+                self._reader_thread = None
+
             if self.stream:
                 try:
-                    self.stream.stop_stream()
+                    self.stream.stop()
                     self.stream.close()
                 except Exception as e:
                     logger.warning(f"Error stopping stream: {e}")
                 self.stream = None
 
-            audio_data = b''.join(self.frames)
-            self.frames = []
+            audio_data = self._buffer[:self._write_pos].tobytes()
+            self._write_pos = 0
             logger.debug(f"Recording stopped. Captured {len(audio_data)} bytes")
+            return self._trim_silence(audio_data)
+
+    def _trim_silence(self, audio_data: bytes) -> bytes:
+        """
+        Drop leading and trailing silence from an int16 recording.
+
+        Computes RMS over 20 ms windows and cuts windows below the
+        threshold from both ends (keeping one window of padding), so the
+        server doesn't spend encoder time on silence around the speech.
+        Returns the data unchanged for non-int16 formats.
+        """
+        if self.dtype != "int16" or not audio_data:
             return audio_data
 
-    def save_to_file(self, audio_data: bytes, filepath: str):
-        """Save audio data to a WAV file."""
-        with wave.open(filepath, 'wb') as wf:
+        samples = np.frombuffer(audio_data, dtype=np.int16)
+        window = max(1, int(self.sample_rate * self.SILENCE_WINDOW_SECONDS)) * self.channels
+        num_windows = len(samples) // window
+        if num_windows < 2:
+            return audio_data
+
+        windows = samples[:num_windows * window].astype(np.float32).reshape(num_windows, window)
+        rms = np.sqrt(np.mean(windows * windows, axis=1))
+        loud = np.flatnonzero(rms >= self.SILENCE_RMS_THRESHOLD)
+
+        if len(loud) == 0:
+            logger.debug("Recording is all silence after trim")
+            return b''
+
+        # Keep one window of padding on each side of the speech
+        start = max(0, loud[0] - 1) * window
+        end = min(num_windows, loud[-1] + 2) * window
+        if start == 0 and end >= len(samples):
+            return audio_data
+
+        trimmed = samples[start:end].tobytes()
+        logger.debug(f"Trimmed silence: {len(audio_data)} -> {len(trimmed)} bytes")
+        return trimmed
+
+    def to_wav_bytes(self, audio_data: bytes) -> bytes:
+        """Wrap raw PCM in a WAV container, entirely in memory."""
+        buf = io.BytesIO()
+        with wave.open(buf, 'wb') as wf:
             wf.setnchannels(self.channels)
-            wf.setsampwidth(self.audio.get_sample_size(self.format))
+            wf.setsampwidth(self.sample_width)
             wf.setframerate(self.sample_rate)
             wf.writeframes(audio_data)
+        return buf.getvalue()
+
+    def save_to_file(self, audio_data: bytes, filepath: str):
+        """Save audio data to a WAV file (debugging helper)."""
+        with open(filepath, 'wb') as f:
+            f.write(self.to_wav_bytes(audio_data))
 
     def cleanup(self):
-        """Clean up PyAudio resources."""
+        """Clean up audio resources."""
+        self.is_recording = False
         if self.stream:
             try:
-                self.stream.stop_stream()
+                self.stream.stop()
                 self.stream.close()
             except:
                 pass
-        self.audio.terminate()
+            self.stream = None
 
 
 class TranscriptionClient:
     """Handles communication with the speech-to-text server."""
 
+    # Lock onto a detected language once the server is at least this
+    # confident; later requests then skip the language-detection pass
+    LANGUAGE_LOCK_CONFIDENCE = 0.9
+
+    # Recent transcriptions kept by audio fingerprint; repeated commands
+    # and wake-phrases then skip the Whisper round-trip entirely
+    CACHE_SIZE = 128
+
     def __init__(self, config: Config):
         """Initialize the transcription client."""
         self.config = config
-        self.api_url = config['api_url']
+        self.api_url = config.c.api_url
+        self.sample_rate = config.c.audio.sample_rate
+        self.channels = config.c.audio.channels
+        self.sample_width = np.dtype(config.c.audio.format).itemsize
+        self.detected_language = None
+        self._cache = OrderedDict()  # audio hash -> response dict (LRU)
+
+        # The raw octet-stream fast path only carries what the server
+        # accepts verbatim; any other capture config uploads WAV and
+        # lets the server decode/resample it
+        self.raw_pcm_ok = (self.sample_rate == 16000 and
+                           self.channels == 1 and
+                           config.c.audio.format == 'int16')
+
+        # Utterances fired in quick succession can be coalesced into one
+        # /transcribe-batch request, amortizing the HTTP round-trip and
+        # model invocation overhead. Off by default (batch_max_size=1)
+        # since batching trades a little latency for throughput.
+        self.batch_max_size = config.c.batch_max_size
+        self.batch_window_ms = config.c.batch_window_ms
+        self._pending = []  # list of (audio_bytes, Future)
+        self._pending_lock = threading.Lock()
+        self._flush_timer = None
+
         self.session = requests.Session()
 
+        # Keep-alive connection pool with a couple of quick retries, so
+        # repeated hotkey cycles reuse the same TCP connection instead of
+        # re-handshaking per request
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip',
+            'Connection': 'keep-alive'
+        })
+
     def check_server(self) -> dict | None:
         """Check if the server is available and return health info."""
         try:
@@ -256,37 +405,220 @@ class TranscriptionClient:
         except requests.RequestException:
             return None
 
-    def transcribe(self, audio_filepath: str) -> dict:
+    def transcribe(self, audio_bytes: bytes) -> dict:
         """
-        Send audio file to server for transcription.
+        Send recorded audio to the server for transcription.
+
+        With the default 16 kHz mono int16 capture, posts the raw PCM as
+        application/octet-stream, which lets the server skip WAV parsing
+        and ffmpeg entirely; other capture configs are wrapped in a WAV
+        container so the server can decode and resample them.
 
         Args:
-            audio_filepath: Path to the audio file
+            audio_bytes: Raw PCM samples in the configured format
 
         Returns:
             dict with 'text' on success, or 'error' on failure
         """
+        # Exact-match cache on the PCM fingerprint: hashing ~100 KB is
+        # microseconds vs. hundreds of ms for a Whisper round-trip
+        key = hashlib.blake2b(audio_bytes, digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            logger.info("Transcription served from cache")
+            return dict(cached)
+
+        if self.batch_max_size > 1:
+            result = self._enqueue_batched(audio_bytes).result(timeout=90)
+        elif self.raw_pcm_ok:
+            result = self._post_audio(audio_bytes)
+        else:
+            result = self._post_wav(audio_bytes)
+        if 'error' not in result:
+            self._cache[key] = result
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+
+    def _enqueue_batched(self, audio_bytes: bytes) -> Future:
+        """
+        Queue an utterance for batched transcription.
+
+        Utterances arriving within batch_window_ms of each other are
+        coalesced into a single /transcribe-batch POST; the batch is
+        flushed early once batch_max_size utterances are waiting. Each
+        caller blocks on its own Future, so ordering is preserved.
+        """
+        future = Future()
+        flush_now = None
+        with self._pending_lock:
+            self._pending.append((audio_bytes, future))
+            if len(self._pending) >= self.batch_max_size:
+                flush_now, self._pending = self._pending, []
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    self.batch_window_ms / 1000.0, self._flush_pending)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        if flush_now:
+            self._post_batch(flush_now)
+        return future
+
+    def _flush_pending(self):
+        """Timer callback: send whatever utterances are waiting."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+            self._flush_timer = None
+        if pending:
+            self._post_batch(pending)
+
+    def _post_batch(self, pending: list):
+        """POST a batch of utterances and fan results back to futures."""
+        # A batch of one doesn't need the multipart overhead
+        if len(pending) == 1:
+            audio_bytes, future = pending[0]
+            if self.raw_pcm_ok:
+                future.set_result(self._post_audio(audio_bytes))
+            else:
+                future.set_result(self._post_wav(audio_bytes))
+            return
+
+        logger.info(f"Sending batch of {len(pending)} utterances")
         try:
-            with open(audio_filepath, 'rb') as audio_file:
-                files = {'audio': ('audio.wav', audio_file, 'audio/wav')}
-                data = {}
-
-                # Add language if specified
-                if self.config.get('language'):
-                    data['language'] = self.config['language']
-
-                response = self.session.post(
-                    f"{self.api_url}/transcribe",
-                    files=files,
-                    data=data,
-                    timeout=60  # Allow up to 60 seconds for transcription
-                )
+            files = [
+                ('audio', (f'{i}.wav', self._wrap_wav(audio_bytes), 'audio/wav'))
+                for i, (audio_bytes, _) in enumerate(pending)
+            ]
+            data = {}
+            language = self._request_language()
+            if language:
+                data['language'] = language
+
+            response = self.session.post(
+                f"{self.api_url}/transcribe-batch",
+                files=files,
+                data=data,
+                timeout=60
+            )
 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    error_msg = response.json().get('error', 'Unknown error')
-                    return {'error': error_msg}
+            if response.status_code == 200:
+                results = response.json().get('results', [])
+                for (_, future), result in zip(pending, results):
+                    self._maybe_lock_language(result)
+                    future.set_result(result)
+                for _, future in pending[len(results):]:
+                    future.set_result(
+                        {'error': 'Missing result in batch response'})
+            else:
+                error_msg = response.json().get('error', 'Unknown error')
+                for _, future in pending:
+                    future.set_result({'error': error_msg})
+
+        except requests.Timeout:
+            for _, future in pending:
+                future.set_result(
+                    {'error': 'Server timeout - transcription took too long'})
+        except requests.ConnectionError:
+            for _, future in pending:
+                future.set_result(
+                    {'error': 'Cannot connect to server. Is Docker running?'})
+        except Exception as e:
+            for _, future in pending:
+                future.set_result({'error': str(e)})
+
+    def _wrap_wav(self, audio_bytes: bytes) -> bytes:
+        """Wrap raw PCM in a WAV container for multipart upload."""
+        buf = io.BytesIO()
+        with wave.open(buf, 'wb') as wf:
+            wf.setnchannels(self.channels)
+            wf.setsampwidth(self.sample_width)
+            wf.setframerate(self.sample_rate)
+            wf.writeframes(audio_bytes)
+        return buf.getvalue()
+
+    def transcribe_stream(self, chunk_queue: "queue.Queue") -> dict:
+        """
+        Stream raw PCM chunks to the server while recording continues.
+
+        Blocks until a None sentinel arrives on the queue and the server
+        responds, so this is meant to run on an uploader thread. The
+        upload overlaps the recording, leaving only the final chunks to
+        send at hotkey release.
+
+        Args:
+            chunk_queue: Queue of raw PCM chunks, terminated by None
+
+        Returns:
+            dict with 'text' on success, or 'error' on failure
+        """
+        def generate():
+            while True:
+                chunk = chunk_queue.get()
+                if chunk is None:
+                    return
+                yield chunk
+
+        return self._post_audio(generate())
+
+    def _post_audio(self, data) -> dict:
+        """POST raw PCM (bytes or a chunk generator) to /transcribe."""
+        # Raw posts carry no form body, so language goes in the query
+        # string and the PCM layout in headers
+        params = {}
+        language = self._request_language()
+        if language:
+            params['language'] = language
+        return self._post_transcribe(
+            data=data,
+            params=params,
+            headers={
+                'Content-Type': 'application/octet-stream',
+                'X-Sample-Rate': str(self.sample_rate),
+                'X-Channels': str(self.channels),
+                'X-Format': self.config.c.audio.format
+            }
+        )
+
+    def _post_wav(self, audio_bytes: bytes) -> dict:
+        """POST a WAV upload for capture configs the raw path can't carry."""
+        data = {}
+        language = self._request_language()
+        if language:
+            data['language'] = language
+        return self._post_transcribe(
+            files={'audio': ('audio.wav', self._wrap_wav(audio_bytes),
+                             'audio/wav')},
+            data=data
+        )
+
+    def _request_language(self):
+        """Configured language, or the one detected on an earlier utterance.
+
+        Push-to-talk users rarely switch, and pinning the language skips
+        the server's language-detection pass.
+        """
+        return self.config.c.language or self.detected_language
+
+    def _post_transcribe(self, **kwargs) -> dict:
+        """POST to /transcribe and normalize the response and errors."""
+        try:
+            response = self.session.post(
+                f"{self.api_url}/transcribe",
+                timeout=60,  # Allow up to 60 seconds for transcription
+                **kwargs
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                self._maybe_lock_language(result)
+                return result
+            else:
+                error_msg = response.json().get('error', 'Unknown error')
+                return {'error': error_msg}
 
         except requests.Timeout:
             return {'error': 'Server timeout - transcription took too long'}
@@ -295,6 +627,18 @@ class TranscriptionClient:
         except Exception as e:
             return {'error': str(e)}
 
+    def _maybe_lock_language(self, result: dict):
+        """Remember a confidently detected language for later requests."""
+        if self.config.c.language or self.detected_language:
+            return
+        language = result.get('language')
+        probability = result.get('language_probability', 0)
+        if (language and result.get('text', '').strip() and
+                probability >= self.LANGUAGE_LOCK_CONFIDENCE):
+            self.detected_language = language
+            logger.info(f"Locked language to '{language}' "
+                        f"(probability {probability:.2f})")
+
 
 class SystrayManager:
     """Manages the system tray icon and menu."""
@@ -305,12 +649,46 @@ class SystrayManager:
     COLOR_RECORDING = (200, 50, 50)    # Red - recording
     COLOR_PROCESSING = (50, 100, 200)  # Blue - processing
 
+    STATUS_COLORS = {
+        "idle": COLOR_IDLE,
+        "ready": COLOR_READY,
+        "recording": COLOR_RECORDING,
+        "processing": COLOR_PROCESSING
+    }
+
+    # Fallback-icon geometry, computed once for the 64x64 canvas: each
+    # entry is an ImageDraw method name, positional args, and keyword
+    # args. A fill of None is replaced by the status color at draw time;
+    # the rest is the same white microphone for every status.
+    _ICON_SIZE = 64
+    _MIC_COLOR = (255, 255, 255)
+    _MIC_OPS = (
+        # Outer circle (fill takes the status color)
+        ('ellipse', ([4, 4, 60, 60],),
+         {'fill': None, 'outline': _MIC_COLOR}),
+        # Mic body
+        ('rounded_rectangle', ([24, 12, 40, 36],),
+         {'radius': 8, 'fill': _MIC_COLOR}),
+        # Mic stand arc
+        ('arc', ([18, 20, 46, 48],),
+         {'start': 0, 'end': 180, 'fill': _MIC_COLOR, 'width': 3}),
+        # Mic stand
+        ('line', ([32, 48, 32, 56],), {'fill': _MIC_COLOR, 'width': 3}),
+        ('line', ([22, 56, 42, 56],), {'fill': _MIC_COLOR, 'width': 3}),
+    )
+
     def __init__(self, app):
         """Initialize the systray manager."""
         self.app = app
         self.icon = None
         self.current_status = "idle"
         self.server_info = None  # Health endpoint data: model, device, compute_type
+        # Render each status icon once; status changes happen several
+        # times per hotkey press and shouldn't redo the PIL work
+        self._icon_cache = {
+            status: self._create_image(color)
+            for status, color in self.STATUS_COLORS.items()
+        }
         self._create_icon()
 
     def _create_image(self, color):
@@ -326,29 +704,15 @@ class SystrayManager:
             except Exception:
                 pass
 
-        # Fallback: create a simple colored circle icon
-        size = 64
-        image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        # Fallback: draw the precomputed microphone shape, substituting
+        # the status color for the outer circle's fill
+        image = Image.new('RGBA', (self._ICON_SIZE, self._ICON_SIZE),
+                          (0, 0, 0, 0))
         draw = ImageDraw.Draw(image)
-
-        # Draw a microphone-like shape
-        # Outer circle
-        margin = 4
-        draw.ellipse([margin, margin, size - margin, size - margin],
-                     fill=color, outline=(255, 255, 255))
-
-        # Inner microphone shape
-        mic_color = (255, 255, 255)
-        center_x = size // 2
-        # Mic body
-        draw.rounded_rectangle([center_x - 8, 12, center_x + 8, 36],
-                               radius=8, fill=mic_color)
-        # Mic stand arc
-        draw.arc([center_x - 14, 20, center_x + 14, 48],
-                 start=0, end=180, fill=mic_color, width=3)
-        # Mic stand
-        draw.line([center_x, 48, center_x, 56], fill=mic_color, width=3)
-        draw.line([center_x - 10, 56, center_x + 10, 56], fill=mic_color, width=3)
+        for method, args, kwargs in self._MIC_OPS:
+            if kwargs.get('fill') is None:
+                kwargs = dict(kwargs, fill=color)
+            getattr(draw, method)(*args, **kwargs)
 
         return image
 
@@ -372,7 +736,7 @@ class SystrayManager:
                 enabled=False
             ),
             pystray.MenuItem(
-                lambda item: f"Hotkey: {self.app.config['hotkey'].upper()}",
+                lambda item: f"Hotkey: {self.app.config.c.hotkey.upper()}",
                 None,
                 enabled=False
             ),
@@ -396,7 +760,7 @@ class SystrayManager:
 
         self.icon = pystray.Icon(
             "speech-to-text",
-            self._create_image(self.COLOR_IDLE),
+            self._icon_cache["idle"],
             "Speech-to-Text (Starting...)",
             menu
         )
@@ -428,7 +792,7 @@ class SystrayManager:
 
     def _can_control_server(self):
         """Check if server control is configured."""
-        return bool(self.app.config.get('docker_compose_path'))
+        return bool(self.app.config.c.docker_compose_path)
 
     def _on_start_server(self, icon, item):
         """Handle start server menu item."""
@@ -446,18 +810,9 @@ class SystrayManager:
         elif status == "idle":
             self.server_info = None  # Clear server info when disconnected
 
-        color_map = {
-            "idle": self.COLOR_IDLE,
-            "ready": self.COLOR_READY,
-            "recording": self.COLOR_RECORDING,
-            "processing": self.COLOR_PROCESSING
-        }
-
-        color = color_map.get(status, self.COLOR_IDLE)
-
         # Update icon image
         if self.icon:
-            self.icon.icon = self._create_image(color)
+            self.icon.icon = self._icon_cache.get(status, self._icon_cache["idle"])
             # Update tooltip
             tooltip = f"Speech-to-Text - {self._get_status_text()}"
             self.icon.title = tooltip
@@ -475,6 +830,19 @@ class SystrayManager:
             self.icon.stop()
 
 
+# Windows virtual-key codes for keys usable in a hotkey chord, so press
+# checks can go straight to GetAsyncKeyState instead of the keyboard
+# library's Python-level state table
+VK_CODES = {
+    'ctrl': 0x11, 'shift': 0x10, 'alt': 0x12,
+    'windows': 0x5B, 'win': 0x5B,
+    'space': 0x20, 'tab': 0x09, 'enter': 0x0D, 'esc': 0x1B,
+}
+VK_CODES.update({chr(c): c for c in range(ord('0'), ord('9') + 1)})
+VK_CODES.update({chr(c).lower(): c for c in range(ord('A'), ord('Z') + 1)})
+VK_CODES.update({f'f{n}': 0x70 + n - 1 for n in range(1, 25)})
+
+
 class PushToTalkApp:
     """Main application class for push-to-talk functionality."""
 
@@ -494,6 +862,49 @@ class PushToTalkApp:
         # State
         self.is_pressed = False
         self.running = True
+        # In-flight streaming upload for the current utterance, as a
+        # (queue, thread, result holder) tuple. Only the hook thread
+        # rebinds this; workers get their utterance's tuple by argument
+        self._stream_upload = None
+
+        # Worker pool for the transcribe/paste pipeline, so the keyboard
+        # hook thread is never blocked on the network
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
+        # Parse the hotkey chord once; the press hook only needs to
+        # verify the modifiers, not re-parse the whole string
+        hotkey_parts = self.config.c.hotkey.split('+')
+        self._modifier_keys = tuple(hotkey_parts[:-1])
+        self._main_key = hotkey_parts[-1]
+
+        # On Windows, check modifiers with GetAsyncKeyState - one syscall
+        # per key instead of the keyboard library's locked state table
+        self._user32 = None
+        self._modifier_vks = None
+        if sys.platform == 'win32':
+            try:
+                import ctypes
+                vks = tuple(VK_CODES[k.lower()] for k in self._modifier_keys)
+                self._user32 = ctypes.WinDLL('user32', use_last_error=True)
+                self._modifier_vks = vks
+            except KeyError:
+                logger.debug("Hotkey modifier has no VK code, using keyboard fallback")
+            except Exception as e:
+                logger.debug(f"GetAsyncKeyState unavailable: {e}")
+
+        # Elsewhere, resolve each modifier to its scan codes once at
+        # startup. keyboard.is_pressed() re-parses the key string on
+        # every call; checking the library's _pressed_events table
+        # directly (private API, but stable) skips all of that
+        self._modifier_scans = None
+        if self._modifier_vks is None and self._modifier_keys:
+            try:
+                self._modifier_scans = tuple(
+                    keyboard.key_to_scan_codes(k)
+                    for k in self._modifier_keys
+                )
+            except Exception as e:
+                logger.debug(f"Scan-code lookup failed, using is_pressed: {e}")
 
         # Initialize systray
         self.systray = SystrayManager(self)
@@ -555,7 +966,7 @@ class PushToTalkApp:
     def start_docker_server(self):
         """Start the Docker server (non-blocking, runs in background thread)."""
         def _start():
-            compose_path = self.config.get('docker_compose_path')
+            compose_path = self.config.c.docker_compose_path
             if not compose_path:
                 logger.error("docker_compose_path not configured")
                 return
@@ -565,7 +976,7 @@ class PushToTalkApp:
                 logger.error(f"docker-compose.yml not found in {compose_path}")
                 return
 
-            profile = self.config.get('server_profile', 'cpu')
+            profile = self.config.c.server_profile
             logger.info(f"Starting Docker server ({profile} mode)...")
 
             if profile == 'gpu':
@@ -604,13 +1015,13 @@ class PushToTalkApp:
     def stop_docker_server(self):
         """Stop the Docker server (non-blocking, runs in background thread)."""
         def _stop():
-            compose_path = self.config.get('docker_compose_path')
+            compose_path = self.config.c.docker_compose_path
             if not compose_path:
                 logger.error("docker_compose_path not configured")
                 return
 
             compose_dir = Path(compose_path)
-            profile = self.config.get('server_profile', 'cpu')
+            profile = self.config.c.server_profile
             logger.info("Stopping Docker server...")
 
             if profile == 'gpu':
@@ -632,6 +1043,32 @@ class PushToTalkApp:
 
         threading.Thread(target=_stop, daemon=True).start()
 
+    def _start_stream_upload(self):
+        """Open the transcription POST and stream chunks as they arrive."""
+        # All per-utterance state lives in this tuple: transcriptions
+        # finish on worker threads, so by the time one completes a new
+        # utterance may already own self._stream_upload
+        chunk_queue = queue.Queue()
+        result_holder = {}
+
+        def _upload():
+            result_holder['result'] = self.client.transcribe_stream(chunk_queue)
+
+        thread = threading.Thread(target=_upload, daemon=True)
+        thread.start()
+        self.recorder.stream_queue = chunk_queue
+        self._stream_upload = (chunk_queue, thread, result_holder)
+
+    def _finish_stream_upload(self, stream_upload) -> dict:
+        """Signal end of audio and wait for the in-flight response."""
+        chunk_queue, thread, result_holder = stream_upload
+        chunk_queue.put(None)
+        thread.join(timeout=60)
+        if thread.is_alive():
+            return {'error': 'Server timeout - transcription took too long'}
+        return result_holder.get(
+            'result', {'error': 'Streaming upload produced no result'})
+
     def on_hotkey_press(self):
         """Called when hotkey is pressed - start recording."""
         if not self.is_pressed:
@@ -639,9 +1076,20 @@ class PushToTalkApp:
             logger.info("Recording started - speak now...")
             self.systray.set_status("recording")
             try:
+                # Streaming upload overlaps the network transfer with the
+                # recording itself, so only the tail is left to send at
+                # release (at the cost of uploading untrimmed audio).
+                # Only the raw PCM path can stream; other capture
+                # configs fall back to the buffered WAV upload.
+                if self.config.c.stream_upload and self.client.raw_pcm_ok:
+                    self._start_stream_upload()
                 self.recorder.start_recording()
             except Exception as e:
                 logger.error(f"Error starting recording: {e}")
+                if self._stream_upload is not None:
+                    self._stream_upload[0].put(None)
+                    self._stream_upload = None
+                    self.recorder.stream_queue = None
                 self.is_pressed = False
                 self.systray.set_status("ready")
 
@@ -651,109 +1099,103 @@ class PushToTalkApp:
             self.is_pressed = False
             logger.info("Recording stopped")
 
-            # Stop recording and get audio data
+            # Claim this utterance's streaming state here on the hook
+            # thread, so a new press can't swap it out from under the
+            # worker that finishes the upload
+            stream_upload = self._stream_upload
+            self._stream_upload = None
+
+            # Stop recording and get audio data (the reader thread
+            # drains its last chunks before stop_recording returns)
             audio_data = self.recorder.stop_recording()
+            self.recorder.stream_queue = None
 
-            if len(audio_data) < 1000:  # Too short
+            if stream_upload is None and len(audio_data) < 1000:  # Too short
                 logger.warning("Recording too short, ignoring")
                 self.systray.set_status("ready")
                 return
 
-            # Save to temporary file
-            temp_file = None
-            try:
-                temp_file = tempfile.NamedTemporaryFile(
-                    suffix='.wav',
-                    delete=False
-                )
-                temp_file.close()
-                self.recorder.save_to_file(audio_data, temp_file.name)
+            # The POST can take up to 60s; run it on a worker so the
+            # hook thread returns immediately and the next hotkey press
+            # isn't blocked behind this transcription
+            self.systray.set_status("processing")
+            self._executor.submit(
+                self._finish_transcription, audio_data, stream_upload)
 
-                # Send for transcription
-                logger.info("Processing transcription...")
-                self.systray.set_status("processing")
-                result = self.client.transcribe(temp_file.name)
+    def _finish_transcription(self, audio_data: bytes, stream_upload):
+        """Transcribe and paste; runs on a worker thread."""
+        try:
+            # Send the raw PCM for transcription - no WAV container needed
+            logger.info("Processing transcription...")
+            if stream_upload is not None:
+                result = self._finish_stream_upload(stream_upload)
+            else:
+                result = self.client.transcribe(audio_data)
 
-                if 'error' in result:
-                    logger.error(f"Transcription error: {result['error']}")
+            if 'error' in result:
+                logger.error(f"Transcription error: {result['error']}")
+            else:
+                text = result.get('text', '').strip()
+
+                if text:
+                    logger.info(f"Transcription: {text}")
+
+                    # Copy to clipboard and paste if enabled
+                    if self.config.c.copy_to_clipboard:
+                        try:
+                            pyperclip.copy(text)
+                            logger.info("Text copied to clipboard")
+                            # Poll until the clipboard actually holds the
+                            # text (capped at ~50 ms) instead of a fixed
+                            # sleep - usually ready on the first check
+                            for _ in range(10):
+                                if pyperclip.paste() == text:
+                                    break
+                                time.sleep(0.005)
+                            # Paste into current cursor position
+                            keyboard.send('ctrl+v')
+                            logger.info("Text pasted")
+                        except Exception as e:
+                            logger.warning(f"Could not copy/paste: {e}")
                 else:
-                    text = result.get('text', '').strip()
-
-                    if text:
-                        logger.info(f"Transcription: {text}")
-
-                        # Copy to clipboard and paste if enabled
-                        if self.config.get('copy_to_clipboard', True):
-                            try:
-                                pyperclip.copy(text)
-                                logger.info("Text copied to clipboard")
-                                # Small delay to ensure clipboard is ready
-                                time.sleep(0.05)
-                                # Paste into current cursor position
-                                keyboard.send('ctrl+v')
-                                logger.info("Text pasted")
-                            except Exception as e:
-                                logger.warning(f"Could not copy/paste: {e}")
-                    else:
-                        logger.warning("No speech detected")
-
-                    # Show detected language
-                    if 'language' in result:
-                        logger.debug(f"Detected language: {result['language']}")
+                    logger.warning("No speech detected")
 
-            except Exception as e:
-                logger.error(f"Transcription failed: {e}")
-
-            finally:
-                # Clean up temp file
-                if temp_file and os.path.exists(temp_file.name):
-                    try:
-                        os.unlink(temp_file.name)
-                    except:
-                        pass
+                # Show detected language
+                if 'language' in result:
+                    logger.debug(f"Detected language: {result['language']}")
+
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+
+        finally:
+            # Leave the icon alone if the user is already holding the
+            # hotkey for the next utterance
+            if not self.is_pressed:
                 self.systray.set_status("ready")
 
-    def _hotkey_loop(self):
-        """Background thread for hotkey detection."""
-        hotkey = self.config['hotkey']
+    def _register_hotkey(self):
+        """
+        Register event-driven hotkey handlers.
 
-        # Register hotkey handlers
+        The keyboard library fires these callbacks directly from its hook
+        thread, so no polling loop is needed - the process sleeps while
+        the hotkey is untouched instead of waking every 10 ms.
+        """
+        # One mechanism only: hooks on the chord's main key, with the
+        # press hook validating the cached modifiers. The old add_hotkey
+        # fallback was a second code path matching the same keystrokes.
         # suppress=True prevents the key from being passed to other applications
         # This stops F13 from outputting escape sequences like [25~ in terminals
-        try:
-            keyboard.on_press_key(
-                hotkey.split('+')[-1],  # Get the main key
-                lambda e: self._check_hotkey_press(),
-                suppress=True
-            )
-            keyboard.on_release_key(
-                hotkey.split('+')[-1],
-                lambda e: self._check_hotkey_release(),
-                suppress=True
-            )
-        except Exception as e:
-            # Fallback: use keyboard.add_hotkey for the full combination
-            logger.debug(f"Using fallback hotkey method: {e}")
-            keyboard.add_hotkey(
-                hotkey,
-                self.on_hotkey_press,
-                suppress=True,
-                trigger_on_release=False
-            )
-
-        # Poll for hotkey state
-        while self.running:
-            try:
-                if keyboard.is_pressed(hotkey):
-                    if not self.is_pressed:
-                        self.on_hotkey_press()
-                else:
-                    if self.is_pressed:
-                        self.on_hotkey_release()
-                time.sleep(0.01)  # Small delay to reduce CPU usage
-            except Exception as e:
-                logger.debug(f"Hotkey check error: {e}")
-                time.sleep(0.1)
+        keyboard.on_press_key(
+            self._main_key,
+            lambda e: self._check_hotkey_press(),
+            suppress=True
+        )
+        keyboard.on_release_key(
+            self._main_key,
+            lambda e: self._check_hotkey_release(),
+            suppress=True
+        )
 
     def _health_check_loop(self):
         """Background thread to periodically check server status."""
@@ -766,16 +1208,18 @@ class PushToTalkApp:
 
     def run(self):
         """Main application loop."""
-        hotkey = self.config['hotkey']
+        hotkey = self.config.c.hotkey
         logger.info(f"Hotkey: {hotkey.upper()}")
         logger.info("Hold the hotkey and speak, then release to transcribe.")
         logger.info("Right-click the system tray icon to exit.")
 
-        # Initial server check (non-blocking)
+        # Initial server check; this also establishes the pooled
+        # keep-alive connection, so the first transcription doesn't pay
+        # the TCP handshake
         self.check_server_connection()
 
-        # Start background threads
-        threading.Thread(target=self._hotkey_loop, daemon=True).start()
+        # Hotkey handling is event-driven; only the health check needs a thread
+        self._register_hotkey()
         threading.Thread(target=self._health_check_loop, daemon=True).start()
 
         # Run systray in main thread (blocking)
@@ -789,9 +1233,21 @@ class PushToTalkApp:
         return 0
 
     def _check_hotkey_press(self):
-        """Check if full hotkey combination is pressed."""
-        hotkey = self.config['hotkey']
-        if keyboard.is_pressed(hotkey):
+        """Check if the rest of the hotkey chord is held down."""
+        # The hook already fired for the main key; only the cached
+        # modifiers need checking (no-op for single-key hotkeys like F13)
+        if self._modifier_vks is not None:
+            get_key_state = self._user32.GetAsyncKeyState
+            if all(get_key_state(vk) & 0x8000 for vk in self._modifier_vks):
+                self.on_hotkey_press()
+        elif self._modifier_scans is not None:
+            # A modifier counts as held if any of its scan codes (e.g.
+            # left or right ctrl) appears in the pressed-events table
+            pressed = keyboard._pressed_events
+            if all(any(sc in pressed for sc in scans)
+                   for scans in self._modifier_scans):
+                self.on_hotkey_press()
+        elif all(keyboard.is_pressed(mod) for mod in self._modifier_keys):
             self.on_hotkey_press()
 
     def _check_hotkey_release(self):
@@ -802,6 +1258,7 @@ class PushToTalkApp:
     def cleanup(self):
         """Clean up resources."""
         self.running = False
+        self._executor.shutdown(wait=False)
         self.recorder.cleanup()
         keyboard.unhook_all()
         logger.info("Goodbye!")